@@ -1,21 +1,100 @@
 from nicegui import ui
-import requests
-import io
+import httpx
 import re
 import os
+import atexit
+import shutil
+import tempfile
+import asyncio
+import concurrent.futures
+import functools
+import threading
 from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, ListFlowable, ListItem
-from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import BaseDocTemplate, PageTemplate, Frame, Paragraph, Spacer
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab import rl_config
 
 API_BASE = "/api"
 
-def call_api(endpoint, method="get", payload=None, params=None):
+# Skip ReportLab's per-attribute shape validation unless debugging PDF output
+if not os.environ.get("PDF_DEBUG"):
+    rl_config.shapeChecking = 0
+
+# Build the ReportLab stylesheet once instead of on every export
+_PDF_STYLES = getSampleStyleSheet()
+_PDF_BULLET_STYLE = ParagraphStyle('bullet', parent=_PDF_STYLES['Normal'], bulletIndent=10, leftIndent=20)
+
+# Exported PDFs are written here and streamed from disk by ui.download.
+# Each file is removed when its browser client disconnects; the rmtree
+# only catches leftovers at shutdown.
+_PDF_DIR = tempfile.mkdtemp(prefix="bi_pro_pdf_")
+atexit.register(shutil.rmtree, _PDF_DIR, ignore_errors=True)
+
+
+def _discard_pdf(path):
     try:
-        url = f"{API_BASE}{endpoint}"
-        if method.lower() == "get":
-            r = requests.get(url, params=params, timeout=15)
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+# ReportLab rendering runs on worker threads so exports never stall the UI loop
+_PDF_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count())
+
+# Page templates are built once per worker thread; Frames carry layout state,
+# so they are not shared across threads
+_PDF_LOCAL = threading.local()
+
+
+def _new_doc(target):
+    """Return a letter-size document reusing this thread's page templates."""
+    templates = getattr(_PDF_LOCAL, "page_templates", None)
+    if templates is None:
+        doc = BaseDocTemplate(target, pagesize=letter)
+        frame = Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height, id='normal')
+        templates = _PDF_LOCAL.page_templates = [PageTemplate(id='Normal', frames=[frame], pagesize=letter)]
+    return BaseDocTemplate(target, pagesize=letter, pageTemplates=templates)
+
+
+def _build_pdf(target, story):
+    _new_doc(target).build(story)
+
+
+_SECTION_SPLIT = re.compile(r"\n?\d\)")
+_BULLET_SPLIT = re.compile(r"\s+-\s+")
+
+
+def _parse_sections(insights_text):
+    """
+    Split strategic insight text into (heading, bullets) pairs.
+    Sections without a " - " separator come back with heading None.
+    """
+    if not insights_text or not insights_text.strip():
+        return []
+
+    parsed = []
+    sections = [s for s in map(str.strip, _SECTION_SPLIT.split(insights_text)) if s]
+    for section in sections:
+        # First token is the heading, the rest are bullets
+        tokens = _BULLET_SPLIT.split(section)
+        if len(tokens) > 1:
+            parsed.append((tokens[0], [b for b in tokens[1:] if b]))
         else:
-            r = requests.post(url, json=payload, timeout=30)
+            parsed.append((None, [section]))
+    return parsed
+
+# Shared async client so backend calls reuse connections and never block the UI loop
+_CLIENT = httpx.AsyncClient(
+    http2=True,
+    base_url=API_BASE,
+    timeout=30,
+    limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+    headers={"Connection": "keep-alive"},
+)
+
+async def call_api_async(endpoint, method="get", payload=None, params=None):
+    try:
+        timeout = 15 if method.lower() == "get" else 30
+        r = await _CLIENT.request(method.upper(), endpoint, json=payload, params=params, timeout=timeout)
         
         if r.status_code == 200:
             return r.json()
@@ -54,7 +133,7 @@ def main_page():
 
             last_insights = {}
 
-            def generate_action():
+            async def generate_action():
                 if not company_input.value.strip():
                     ui.notify("Please enter a company name.", color="orange")
                     return
@@ -65,10 +144,12 @@ def main_page():
                 website_input = url_input.value.strip()
                 enrich_payload = {
                     "company_name": company_input.value.strip(),
-                    "company_url": website_input if website_input else ""
+                    "company_url": website_input if website_input else "",
+                    # The insights call classifies industry in its own Groq request
+                    "defer_industry": True
                 }
                 
-                enrich_data = call_api("/enrich/", method="post", payload=enrich_payload)
+                enrich_data = await call_api_async("/enrich/", method="post", payload=enrich_payload)
                 if not enrich_data or enrich_data.get('status') != 'success':
                     analysis_progress.set_visibility(False)
                     ui.notify("⚠️ Research failed - please verify company name.", color="red")
@@ -88,7 +169,7 @@ def main_page():
                     "include_strategic_research": strategic_toggle.value
                 }
                 
-                insights_data = call_api("/insights/", method="post", payload=insights_payload)
+                insights_data = await call_api_async("/insights/", method="post", payload=insights_payload)
                 analysis_progress.set_visibility(False)
                 
                 result_area.clear()
@@ -97,7 +178,12 @@ def main_page():
 
                 if insights_data and insights_data.get('status') == 'success':
                     i = insights_data['insights'][0]
-                    last_insights = i
+                    insights_text = i.get('strategic_insight', '')
+                    # Parse once; the on-screen view and PDF export both read this
+                    last_insights = {
+                        **i,
+                        "parsed_sections": _parse_sections(insights_text)
+                    }
                     with result_area:
                         ui.markdown(f"### 🏢 {i['company_name']}")
                         ui.markdown(f"**Industry:** {i.get('industry', 'Unknown')}")
@@ -108,19 +194,12 @@ def main_page():
 
                         # --- Structured Strategic Insights ---
                         ui.markdown("### 📊 Strategic Assessment")
-                        insights_text = i.get('strategic_insight', '')
-                        if insights_text:
-                            sections = re.split(r"\n?\d\)", insights_text)
-                            for section in sections:
-                                if section.strip():
-                                    parts = section.split(" - ", 1)
-                                    if len(parts) == 2:
-                                        ui.markdown(f"**{parts[0].strip()}**")
-                                        bullets = [s.strip() for s in parts[1].split(" - ") if s.strip()]
-                                        for b in bullets:
-                                            ui.markdown(f"• {b}")
-                                    else:
-                                        ui.markdown(f"• {section.strip()}")
+                        if last_insights["parsed_sections"]:
+                            for heading, bullets in last_insights["parsed_sections"]:
+                                if heading is not None:
+                                    ui.markdown(f"**{heading}**")
+                                for b in bullets:
+                                    ui.markdown(f"• {b}")
                         else:
                             ui.markdown("No strategic analysis available.")
 
@@ -131,10 +210,10 @@ def main_page():
                                 ui.label(f"• {news_item}")
 
                         # --- Export PDF button ---
-                        def export_pdf():
-                            buffer = io.BytesIO()
-                            doc = SimpleDocTemplate(buffer, pagesize=letter)
-                            styles = getSampleStyleSheet()
+                        async def export_pdf():
+                            fd, pdf_path = tempfile.mkstemp(suffix=".pdf", dir=_PDF_DIR)
+                            os.close(fd)
+                            styles = _PDF_STYLES
                             story = []
 
                             story.append(Paragraph(f"<b>Company Report: {i.get('company_name','')}</b>", styles['Title']))
@@ -148,21 +227,18 @@ def main_page():
                             story.append(Spacer(1, 12))
 
                             story.append(Paragraph("<b>Strategic Insights</b>", styles['Heading2']))
-                            insights_text = i.get("strategic_insight", "")
-                            if insights_text:
-                                sections = re.split(r"\n?\d\)", insights_text)
-                                for section in sections:
-                                    if section.strip():
-                                        parts = section.split(" - ", 1)
-                                        if len(parts) == 2:
-                                            story.append(Paragraph(f"<b>{parts[0].strip()}</b>", styles['Heading3']))
-                                            bullets = [s.strip() for s in parts[1].split(" - ") if s.strip()]
-                                            story.append(ListFlowable(
-                                                [ListItem(Paragraph(b, styles['Normal'])) for b in bullets],
-                                                bulletType='bullet'
+                            if last_insights["parsed_sections"]:
+                                for heading, bullets in last_insights["parsed_sections"]:
+                                    if heading is not None:
+                                        story.append(Paragraph(f"<b>{heading}</b>", styles['Heading3']))
+                                        # One Paragraph per section keeps markup parsing to a single pass
+                                        if bullets:
+                                            story.append(Paragraph(
+                                                "<br/>".join(f"• {b}" for b in bullets),
+                                                _PDF_BULLET_STYLE
                                             ))
-                                        else:
-                                            story.append(Paragraph(section.strip(), styles['Normal']))
+                                    else:
+                                        story.append(Paragraph(bullets[0], styles['Normal']))
                             else:
                                 story.append(Paragraph("No strategic analysis available.", styles['Normal']))
                             story.append(Spacer(1, 12))
@@ -172,10 +248,14 @@ def main_page():
                                 for news_item in i["news"][:3]:
                                     story.append(Paragraph(f"• {news_item}", styles['Normal']))
 
-                            doc.build(story)
-                            pdf_bytes = buffer.getvalue()
-                            buffer.close()
-                            ui.download(pdf_bytes, filename=f"{i['company_name']}_analysis.pdf")
+                            try:
+                                await asyncio.wrap_future(_PDF_POOL.submit(_build_pdf, pdf_path, story))
+                            except Exception:
+                                _discard_pdf(pdf_path)
+                                raise
+                            # ui.download only drops the route, so the file is ours to clean up
+                            ui.context.client.on_delete(functools.partial(_discard_pdf, pdf_path))
+                            ui.download.file(pdf_path, filename=f"{i['company_name']}_analysis.pdf")
 
                         ui.button("⬇️ Export as PDF", on_click=export_pdf).classes('bg-green-600 text-white px-4 py-2 rounded-lg mt-4')
 
@@ -49,9 +49,12 @@ def root():
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
-        "app:app",  
+        "src.backend.app:app",  # import string required for multiple workers
         host="0.0.0.0",
         port=int(os.environ.get("PORT", 8000)),  # 👈 use Render's $PORT
+        loop="uvloop",
+        http="httptools",
+        workers=max(2, (os.cpu_count() or 2) // 2),
         reload=False
     )
 
@@ -1,7 +1,9 @@
 # src/backend/models/lead_model.py
 
-from pydantic import BaseModel, HttpUrl, Field
+from pydantic import BaseModel, ConfigDict, HttpUrl, Field
 
 class Lead(BaseModel):
+    model_config = ConfigDict(extra='ignore', frozen=True)
+
     company_name: str = Field(..., example="OpenAI")
     company_url: HttpUrl | None = Field(None, example="https://openai.com")
@@ -13,3 +13,33 @@ class EnrichedLeadResponse(BaseModel):
     summary: Optional[str]
     colors: Optional[list]
     news: List[NewsItem] = []
+
+class ResearchRecord(BaseModel):
+    company_name: str
+    website: Optional[str] = ""
+    canonical_name: Optional[str] = ""
+    summary: Optional[str] = ""
+    news: List[dict] = []
+    logo: Optional[str] = ""
+    industry: Optional[str] = ""
+    sources_used: List[str] = []
+
+class EnrichResponse(BaseModel):
+    status: str
+    data: List[ResearchRecord]
+    sources_used: List[str] = []
+
+class InsightRecord(BaseModel):
+    company_name: str
+    summary: str = ""
+    industry: str = ""
+    website: str = ""
+    news: List[str] = []
+    strategic_insight: str
+    sources_used: List[str] = []
+    research_depth: str
+
+class InsightResponse(BaseModel):
+    status: str
+    analysis_type: str
+    insights: List[InsightRecord]
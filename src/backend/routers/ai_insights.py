@@ -1,49 +1,90 @@
 from fastapi import APIRouter
 from fastapi.responses import JSONResponse
-from pydantic import BaseModel
-from typing import Optional, List, Any
-from src.backend.utils.api_helpers import generate_ai_insight
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Optional, List
+import asyncio
+import hashlib
+import json
+from src.backend.utils.api_helpers import generate_ai_insight_with_industry
+from src.backend.utils.cache import ttl_cache
+from src.backend.models.response_model import InsightResponse
 
 router = APIRouter()
 
+# Response-level cache so repeat requests skip the LLM round trip
+INSIGHT_CACHE_SIZE = 1024
+INSIGHT_CACHE_TTL = 3600  # seconds
+
+# Fallback messages from generate_ai_insight that should not be cached
+_UNCACHEABLE_PREFIXES = ("Analysis generation failed", "Analysis was truncated")
+
 class EnrichedLead(BaseModel):
+    model_config = ConfigDict(extra='ignore', frozen=True)
+
     company_name: str
     canonical_name: Optional[str] = None
     summary: Optional[str] = None
-    news: Optional[List[Any]] = None
+    news: List[dict] = Field(default_factory=list)
     industry: Optional[str] = None
     website: Optional[str] = None
     sources_used: Optional[List[str]] = None
     include_strategic_research: Optional[bool] = False
 
-@router.post("/", summary="Generate strategic business insights")
-def generate_insight(lead: EnrichedLead):
+    @field_validator("news", mode="before")
+    @classmethod
+    def _news_none_to_empty(cls, value):
+        # Older clients send "news": null
+        return [] if value is None else value
+
+def _insight_cache_key(lead_data: dict) -> str:
+    """Stable hash of the full request, including the strategic research flag."""
+    raw = json.dumps(lead_data, sort_keys=True, default=str)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+@ttl_cache(
+    maxsize=INSIGHT_CACHE_SIZE,
+    ttl=INSIGHT_CACHE_TTL,
+    key=lambda lead: _insight_cache_key(lead.model_dump(exclude_none=True)),
+    cache_if=lambda record: not record["strategic_insight"].startswith(_UNCACHEABLE_PREFIXES)
+)
+async def _build_insight_record(lead: EnrichedLead) -> dict:
+    # Industry is classified in the same Groq call when enrich deferred it
+    insight_text, industry = await asyncio.to_thread(
+        generate_ai_insight_with_industry,
+        lead.model_dump(exclude_none=True),
+        include_strategic_context=lead.include_strategic_research or False
+    )
+    sources_used = list(lead.sources_used or [])
+    if industry != "Unknown" and not lead.industry and "AI Industry Classification" not in sources_used:
+        sources_used.append("AI Industry Classification")
+    return {
+        "company_name": lead.canonical_name or lead.company_name,
+        "summary": lead.summary or "",
+        "industry": industry,
+        "website": lead.website or "",
+        # Titles may be null or non-strings in client payloads; InsightRecord needs str
+        "news": [str(n.get("title") or "") for n in lead.news],
+        "strategic_insight": insight_text,
+        "sources_used": sources_used,
+        "research_depth": "Strategic Context Included" if lead.include_strategic_research else "Standard Analysis"
+    }
+
+@router.post("/", response_model=InsightResponse, summary="Generate strategic business insights")
+async def generate_insight(lead: EnrichedLead):
     """
     Generate AI-based strategic insights for business assessment.
     """
     try:
-        insight_text = generate_ai_insight(
-            lead.dict(), 
-            include_strategic_context=lead.include_strategic_research or False
-        )
-        lead_record = {
-            "company_name": lead.canonical_name or lead.company_name,
-            "summary": lead.summary or "",
-            "industry": lead.industry or "Unknown",
-            "website": lead.website or "",
-            "news": [n.get("title", "") for n in lead.news] if lead.news else [],
-            "strategic_insight": insight_text,
-            "sources_used": lead.sources_used or [],
-            "research_depth": "Strategic Context Included" if lead.include_strategic_research else "Standard Analysis"
-        }
-        return JSONResponse(content={
+        lead_record = await _build_insight_record(lead)
+
+        return {
             "status": "success", 
             "analysis_type": "Business Assessment",
             "insights": [lead_record]
-        })
+        }
     except Exception as e:
         print(f"[ERROR] Strategic insights generation failed: {e}")
         return JSONResponse(
             content={"status": "error", "message": str(e)}, 
             status_code=500
-        )
\ No newline at end of file
+        )
@@ -1,24 +1,49 @@
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from typing import Optional
-from src.backend.utils.api_helpers import research_company_thoroughly
+from src.backend.utils.api_helpers import research_company_thoroughly_async
+from src.backend.utils.cache import ttl_cache
+from src.backend.models.response_model import EnrichResponse
 
 router = APIRouter()
 
+# In-process LRU cache of research results keyed on normalized (company, website)
+RESEARCH_CACHE_SIZE = 512
+RESEARCH_CACHE_TTL = 3600  # seconds
+
 class LeadModel(BaseModel):
     company_name: str
     company_url: Optional[str] = ""  # Change from HttpUrl to str with default ""
+    # Skip the Groq industry fallback when /api/insights/ will classify it anyway
+    defer_industry: Optional[bool] = False
+
+# Don't pin empty results (e.g. upstream outage) for the whole TTL
+@ttl_cache(
+    maxsize=RESEARCH_CACHE_SIZE,
+    ttl=RESEARCH_CACHE_TTL,
+    key=lambda company_name, website="", llm_industry=True: (
+        company_name.lower().strip(), website.lower().strip(), llm_industry
+    ),
+    cache_if=lambda research_data: bool(research_data.get("sources_used"))
+)
+async def _cached_research(company_name: str, website: str = "", llm_industry: bool = True):
+    """Return research for a company, reusing a recent result for the same inputs."""
+    return await research_company_thoroughly_async(
+        company_name=company_name, website=website, llm_industry=llm_industry
+    )
 
-@router.post("/")
+@router.post("/", response_model=EnrichResponse)
 async def enrich_company(lead: LeadModel):
     """
     Enhanced enrichment that actually uses the provided website
     """
     try:
         # Use the new thorough research function
-        research_data = research_company_thoroughly(
+        research_data = await _cached_research(
             company_name=lead.company_name,
-            website=lead.company_url if lead.company_url else ""  # Handle empty string
+            website=lead.company_url if lead.company_url else "",  # Handle empty string
+            llm_industry=not lead.defer_industry
         )
         
         return {
@@ -29,6 +54,5 @@ async def enrich_company(lead: LeadModel):
         
     except Exception as e:
         print(f"[ERROR] Enrichment failed: {e}")
-        return {"status": "error", "message": str(e)}
-
+        return JSONResponse(content={"status": "error", "message": str(e)})
 
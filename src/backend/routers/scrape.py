@@ -1,12 +1,24 @@
 from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+import orjson
 from src.backend.utils.api_helpers import fetch_strategic_context
 
 router = APIRouter()
 
+def _iter_ndjson(research_data):
+    """Yield each research item as one NDJSON line in the expected format."""
+    for item in research_data:
+        yield orjson.dumps({
+            "company_name": item.get("title", ""),
+            "summary": item.get("content", ""),
+            "company_url": item.get("source", "")
+        }) + b"\n"
+
 @router.get("/")
 async def scrape_leads(query: str = Query(..., description="Search phrase for business research")):
     """
     Strategic business research using Serper.dev API.
+    Results are streamed as NDJSON, one item per line.
     Example: /api/scrape?query=ai+startups+in+india
     """
     try:
@@ -17,17 +29,7 @@ async def scrape_leads(query: str = Query(..., description="Search phrase for bu
         if not research_data:
             return {"status": "error", "message": "No research data found or API error."}
         
-        # Transform to match expected format
-        formatted_data = [
-            {
-                "company_name": item.get("title", ""),
-                "summary": item.get("content", ""),
-                "company_url": item.get("source", "")
-            }
-            for item in research_data
-        ]
-        
-        return {"status": "success", "count": len(formatted_data), "data": formatted_data}
+        return StreamingResponse(_iter_ndjson(research_data), media_type="application/x-ndjson")
 
     except Exception as e:
         print(f"[ERROR] Research scraping failed: {e}")
@@ -1,9 +1,27 @@
 # src/backend/utils/api_helpers.py
 import os
+import asyncio
+import codecs
+import functools
+import itertools
+import orjson
+import random
+import re
 import requests
+import requests.adapters
+import threading
 import time
+import urllib3
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-from urllib.parse import urlparse
+from src.backend.utils.cache import ttl_cache
+from src.backend.utils.validation import is_valid_url, parse_url
+
+try:
+    from lxml import etree
+except ImportError:  # fall back to whole-document parsing
+    etree = None
 
 load_dotenv()
 
@@ -15,120 +33,471 @@ GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 
 # Common request config
 DEFAULT_TIMEOUT = 10
-RETRY_COUNT = 2
-RETRY_BACKOFF = 0.5  # seconds
+RETRY_COUNT = 3
+RETRY_BASE_DELAY = 1.0  # seconds
+RETRY_MAX_BACKOFF = 30  # seconds
+RETRY_JITTER = 0.5  # up to +50% random spread
+RETRYABLE_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+
+# Per-host circuit breaker config
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_OPEN_SECONDS = 30
+BREAKER_SUCCESS_THRESHOLD = 2
+BREAKER_CACHE_SIZE = 1024  # hosts tracked at once
+
+# Upstream response cache config
+INDUSTRY_CACHE_TTL = 86400  # industry labels change rarely
+
+INSIGHT_JSON_MAX_TOKENS = 1800  # insight + industry in one JSON-mode reply
+
+# Conditional-GET cache for scraped websites: url -> (etag, last_modified, result)
+SCRAPE_CACHE_SIZE = 512
+_SCRAPE_CACHE = OrderedDict()
+_scrape_cache_lock = threading.Lock()
+
+# Company names that are also common words get disambiguating query terms
+_DISAMBIGUATION_WORDS = frozenset({
+    'stochastic', 'quantum', 'vector', 'matrix', 'alpha', 'beta', 'gamma', 'delta',
+    'sigma', 'lambda', 'omega', 'zen', 'nova', 'pulse', 'flux'
+})
+_STRATEGIC_DISAMBIGUATION = " company tech startup business inc"
+
+# Words suggesting a DuckDuckGo summary describes a company, not a concept
+_COMPANY_INDICATOR_RE = re.compile(r'\b(company|startup|tech|business|inc|corp|ltd|founder|ceo|venture)\b', re.I)
+
+# Each research call fetches at most two sources at once on its own small
+# pool, so a slow upstream can't starve other requests of worker threads
+ENRICH_MAX_WORKERS = 2
+
+# Shared session so repeat calls to the same upstream reuse TCP/TLS connections
+_SESSION = requests.Session()
+_ADAPTER = requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.headers["User-Agent"] = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+)
 
 # -------------------------
 # Utility helpers
 # -------------------------
-def is_valid_url(url: str) -> bool:
-    if not url:
-        return False
-    try:
-        p = urlparse(url)
-        return p.scheme in ("http", "https") and bool(p.netloc)
-    except Exception:
-        return False
-
+@functools.lru_cache(maxsize=4096)
 def extract_domain(url: str) -> str:
     """Return domain from url-like input, else empty string."""
     if not url:
         return ""
-    if not is_valid_url(url):
+    is_valid, netloc = parse_url(url)
+    if not is_valid:
         if "/" not in url and "." in url:
             return url.strip()
         return ""
-    parsed = urlparse(url)
-    return parsed.netloc
+    return netloc
 
-def _safe_get(url, headers=None, params=None, timeout=DEFAULT_TIMEOUT):
-    """Simple wrapper with retries and backoff."""
+class _CircuitBreaker:
+    """
+    Closed -> Open after repeated failures; Open -> HalfOpen once the open
+    window passes; HalfOpen -> Closed after enough successful probes.
+    """
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self):
+        self.state = self.CLOSED
+        self.failure_count = 0
+        self.success_count = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def can_execute(self) -> bool:
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < BREAKER_OPEN_SECONDS:
+                    return False
+                self.state = self.HALF_OPEN
+                self.success_count = 0
+            return True
+
+    def record_outcome(self, success: bool):
+        with self._lock:
+            if success:
+                self.failure_count = 0
+                if self.state == self.HALF_OPEN:
+                    self.success_count += 1
+                    if self.success_count >= BREAKER_SUCCESS_THRESHOLD:
+                        self.state = self.CLOSED
+                return
+            self.failure_count += 1
+            if self.state == self.HALF_OPEN or self.failure_count >= BREAKER_FAILURE_THRESHOLD:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+# Scraped company sites add a host each, so keep only the most recently used
+_breakers = OrderedDict()
+_breakers_lock = threading.Lock()
+
+def _breaker_for(url: str) -> _CircuitBreaker:
+    host = parse_url(url)[1]
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = _CircuitBreaker()
+            while len(_breakers) > BREAKER_CACHE_SIZE:
+                _breakers.popitem(last=False)
+        else:
+            _breakers.move_to_end(host)
+        return breaker
+
+def _backoff_delay(attempt: int) -> float:
+    """Capped exponential backoff with jitter so concurrent retries don't sync up."""
+    delay = min(RETRY_MAX_BACKOFF, RETRY_BASE_DELAY * (2 ** attempt))
+    return delay * (1 + random.uniform(0, RETRY_JITTER))
+
+def _request_with_retries(method, url, **kwargs):
+    """
+    Issue a request, retrying only recoverable failures (connection errors,
+    timeouts, 408/429/5xx). Other client errors fail immediately, and calls
+    to a host whose circuit breaker is open are skipped.
+    """
+    breaker = _breaker_for(url)
+    error = None
     for attempt in range(RETRY_COUNT):
+        # Fail fast while the upstream host is known to be down
+        if not breaker.can_execute():
+            error = error or "circuit open"
+            break
         try:
-            r = requests.get(url, headers=headers, params=params, timeout=timeout)
-            r.raise_for_status()
-            return r
+            r = _SESSION.request(method, url, **kwargs)
+            if r.status_code not in RETRYABLE_STATUS:
+                # Any non-retryable answer means the host itself is healthy
+                breaker.record_outcome(True)
+                if not r.ok:
+                    # Release the pooled connection, even for streamed responses
+                    r.close()
+                    r.raise_for_status()
+                return r
+            r.close()
+            breaker.record_outcome(False)
+            error = f"HTTP {r.status_code}"
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            breaker.record_outcome(False)
+            error = e
         except Exception as e:
-            if attempt < RETRY_COUNT - 1:
-                time.sleep(RETRY_BACKOFF * (attempt + 1))
-                continue
-            print(f"[ERROR] GET {url} failed: {e}")
+            print(f"[ERROR] {method} {url} failed: {e}")
             return None
+        if attempt < RETRY_COUNT - 1:
+            time.sleep(_backoff_delay(attempt))
+    print(f"[ERROR] {method} {url} failed: {error}")
+    return None
+
+def _retry_budget(timeout: float, calls: int = 1) -> float:
+    """Worst-case seconds for `calls` sequential requests through _request_with_retries."""
+    backoff = sum(
+        min(RETRY_MAX_BACKOFF, RETRY_BASE_DELAY * (2 ** attempt)) * (1 + RETRY_JITTER)
+        for attempt in range(RETRY_COUNT - 1)
+    )
+    return calls * (RETRY_COUNT * timeout + backoff)
+
+def _safe_get(url, headers=None, params=None, timeout=DEFAULT_TIMEOUT, stream=False):
+    """Simple wrapper with retries and backoff."""
+    return _request_with_retries("GET", url, headers=headers, params=params, timeout=timeout, stream=stream)
 
 def _safe_post(url, headers=None, json=None, timeout=DEFAULT_TIMEOUT):
-    for attempt in range(RETRY_COUNT):
-        try:
-            r = requests.post(url, headers=headers, json=json, timeout=timeout)
-            r.raise_for_status()
-            return r
-        except Exception as e:
-            if attempt < RETRY_COUNT - 1:
-                time.sleep(RETRY_BACKOFF * (attempt + 1))
-                continue
-            print(f"[ERROR] POST {url} failed: {e}")
-            return None
+    # Serialize with orjson ourselves; callers set the JSON Content-Type header
+    return _request_with_retries("POST", url, headers=headers, data=orjson.dumps(json), timeout=timeout)
+
+def _normalize_domain(domain: str) -> str:
+    domain = domain.strip().lower()
+    return domain[4:] if domain.startswith("www.") else domain
 
 # -------------------------
 # WEBSITE CONTENT EXTRACTION (Robust HTML parsing)
 # -------------------------
+_NOISE_TAGS = ["script", "style", "nav", "header", "footer"]
+_META_CHARSET_RE = re.compile(rb"<meta[^>]+charset=[\"']?([\w-]+)", re.I)
+HTML_CHUNK_SIZE = 16 * 1024
+# Only the head and the first ~500 chars of content are used, so bound
+# download and parse cost on multi-MB pages
+MAX_HTML_BYTES = 512 * 1024
+# gzip/deflate, plus br/zstd when a decoder for them is installed
+_HTML_ACCEPT_ENCODING = urllib3.util.make_headers(accept_encoding=True)["accept-encoding"]
+_CONTENT_SELECTORS = ['main', 'article', '.content', '#content', '.main-content']
+
+def _parse_html(content, encoding=None) -> dict:
+    """
+    Whole-document extraction with BeautifulSoup's built-in parser, used
+    when lxml isn't installed. Without an explicit encoding BeautifulSoup
+    detects the charset itself.
+    """
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(content, 'html.parser', from_encoding=encoding)
+    
+    # Remove script and style elements
+    for script in soup(_NOISE_TAGS):
+        script.decompose()
+    
+    title = soup.find('title')
+    meta_desc = soup.find('meta', attrs={'name': 'description'})
+    first_p = soup.find('p')
+    
+    # Try to find main content
+    main_content = ""
+    for selector in _CONTENT_SELECTORS:
+        main_elem = soup.select_one(selector)
+        if main_elem:
+            main_text = main_elem.get_text().strip()
+            if len(main_text) > 50:  # Only use if substantial content
+                main_content = main_text[:500]
+                break
+    
+    # If no main content found, get body text
+    if not main_content:
+        body = soup.find('body')
+        if body:
+            main_content = body.get_text().strip()[:500]
+    
+    return {
+        "title": title.get_text().strip() if title else "",
+        "description": meta_desc.get('content', '').strip() if meta_desc else "",
+        "headings": [h1.get_text().strip() for h1 in soup.find_all('h1')[:2]],
+        "first_paragraph": first_p.get_text().strip()[:300] if first_p else "",
+        "main_content": main_content
+    }
+
+def _matches_selector(el, selector: str) -> bool:
+    """Match the simple tag / .class / #id selectors in _CONTENT_SELECTORS."""
+    if selector.startswith("."):
+        return selector[1:] in (el.get("class") or "").split()
+    if selector.startswith("#"):
+        return el.get("id") == selector[1:]
+    return el.tag == selector
+
+def _drop_keep_tail(el):
+    """Remove an element like BeautifulSoup's decompose(), keeping the text after it."""
+    parent = el.getparent()
+    if parent is None:
+        return
+    if el.tail:
+        prev = el.getprevious()
+        if prev is not None:
+            prev.tail = (prev.tail or "") + el.tail
+        else:
+            parent.text = (parent.text or "") + el.tail
+    parent.remove(el)
+
+_CONTENT_CHARS = 500
+_PARAGRAPH_CHARS = 300
+
+def _bounded_text(el, limit: int) -> str:
+    """Stripped text of an element, walking only as far as the first `limit` chars."""
+    buf = []
+    total = 0
+    for text in el.itertext():
+        if not total:
+            text = text.lstrip()
+        if text:
+            buf.append(text)
+            total += len(text)
+            if total >= limit:
+                break
+    return "".join(buf)[:limit].rstrip()
+
+def _iter_capped(resp):
+    """Decoded body chunks, stopping after MAX_HTML_BYTES."""
+    read = 0
+    for chunk in resp.iter_content(chunk_size=HTML_CHUNK_SIZE):
+        yield chunk[:MAX_HTML_BYTES - read]
+        read += len(chunk)
+        if read >= MAX_HTML_BYTES:
+            return
+
+def _header_charset(resp):
+    """Charset named in the Content-Type header, or None if absent or unknown."""
+    content_type = resp.headers.get("Content-Type", "")
+    if "charset=" not in content_type:
+        return None
+    charset = content_type.split("charset=", 1)[1].split(";")[0].strip(" \"'")
+    try:
+        codecs.lookup(charset)
+    except LookupError:
+        return None
+    return charset
+
+def _sniff_encoding(resp, first_chunk: bytes) -> str:
+    """Charset from the Content-Type header, else a <meta charset>, else UTF-8."""
+    charset = _header_charset(resp)
+    if charset:
+        return charset
+    match = _META_CHARSET_RE.search(first_chunk[:4096])
+    return match.group(1).decode("ascii") if match else "utf-8"
+
+def _new_pull_parser(encoding: str):
+    """
+    HTMLPullParser for a page charset. Servers send names libxml2 rejects
+    (utf8mb4, none, x-user-defined, latin-1); retry with Python's canonical
+    codec name and fall back to UTF-8 rather than failing the scrape.
+    """
+    candidates = [encoding]
+    try:
+        codec = codecs.lookup(encoding)
+        if codec._is_text_encoding:
+            candidates.append(codec.name)
+    except LookupError:
+        pass
+    for candidate in candidates:
+        try:
+            return etree.HTMLPullParser(events=("start", "end"), encoding=candidate)
+        except LookupError:
+            continue
+    return etree.HTMLPullParser(events=("start", "end"), encoding="utf-8")
+
+def _extract_streaming(resp) -> dict:
+    """
+    Targeted extraction with lxml's pull parser: feed the body chunk by chunk
+    and stop downloading once title, description, two h1s, the first
+    paragraph and a substantial <main> have all been seen. Returns the same
+    fields as _parse_html; pages lacking any of these are parsed
+    to the end or to MAX_HTML_BYTES.
+    """
+    chunks = _iter_capped(resp)
+    first_chunk = next(chunks, b"")
+    parser = _new_pull_parser(_sniff_encoding(resp, first_chunk))
+    
+    # First matching element per field, in document order (like soup.find)
+    title_el = meta_el = first_p = None
+    h1_els = []
+    candidates = {}
+    texts = {}
+    head_closed = False
+    
+    def handle(event, el):
+        nonlocal title_el, meta_el, first_p, head_closed
+        tag = el.tag
+        if not isinstance(tag, str):
+            return
+        if event == "start":
+            if any(a.tag in _NOISE_TAGS for a in el.iterancestors()):
+                return
+            if tag == "title" and title_el is None:
+                title_el = el
+            elif tag == "meta" and meta_el is None and el.get("name") == "description":
+                meta_el = el
+            elif tag == "h1" and len(h1_els) < 2:
+                h1_els.append(el)
+            elif tag == "p" and first_p is None:
+                first_p = el
+            for selector in _CONTENT_SELECTORS:
+                if selector not in candidates and _matches_selector(el, selector):
+                    candidates[selector] = el
+            return
+        # end: noise subtrees are dropped as soon as they close
+        if tag in _NOISE_TAGS:
+            _drop_keep_tail(el)
+        elif tag == "head":
+            head_closed = True
+        elif el is title_el or el in h1_els or el is first_p or el in candidates.values():
+            limit = _PARAGRAPH_CHARS if el is first_p else _CONTENT_CHARS
+            texts[id(el)] = _bounded_text(el, limit)
+    
+    def have_everything():
+        main_el = candidates.get(_CONTENT_SELECTORS[0])
+        return (
+            head_closed
+            and title_el is not None and id(title_el) in texts
+            and len(h1_els) == 2 and all(id(h) in texts for h in h1_els)
+            and first_p is not None and id(first_p) in texts
+            and main_el is not None and len(texts.get(id(main_el), "")) > 50
+        )
+    
+    root = None
+    for chunk in itertools.chain((first_chunk,), chunks):
+        parser.feed(chunk)
+        for event, el in parser.read_events():
+            handle(event, el)
+        if have_everything():
+            break
+    else:
+        root = parser.close()
+        for event, el in parser.read_events():
+            handle(event, el)
+    resp.close()
+    
+    # Try to find main content
+    main_content = ""
+    for selector in _CONTENT_SELECTORS:
+        main_elem = candidates.get(selector)
+        if main_elem is not None:
+            main_text = texts.get(id(main_elem), "")
+            if len(main_text) > 50:  # Only use if substantial content
+                main_content = main_text
+                break
+    
+    # If no main content found, get body text
+    if not main_content and root is not None:
+        body = root.find("body")
+        if body is not None:
+            main_content = _bounded_text(body, _CONTENT_CHARS)
+    
+    return {
+        "title": texts.get(id(title_el), "") if title_el is not None else "",
+        "description": (meta_el.get("content") or "").strip() if meta_el is not None else "",
+        "headings": [texts.get(id(h1), "") for h1 in h1_els],
+        "first_paragraph": texts.get(id(first_p), "") if first_p is not None else "",
+        "main_content": main_content
+    }
+
+def _store_scrape_result(url: str, resp, result: str):
+    """Remember a scrape result along with its validators for revalidation."""
+    etag = resp.headers.get("ETag", "")
+    last_modified = resp.headers.get("Last-Modified", "")
+    if not (etag or last_modified):
+        return
+    with _scrape_cache_lock:
+        _SCRAPE_CACHE[url] = (etag, last_modified, result)
+        _SCRAPE_CACHE.move_to_end(url)
+        while len(_SCRAPE_CACHE) > SCRAPE_CACHE_SIZE:
+            _SCRAPE_CACHE.popitem(last=False)
+
 def scrape_website_content(url: str):
     """
-    Robust website content extraction using BeautifulSoup with html5lib
+    Robust website content extraction: streamed lxml extraction that stops
+    once the needed tags are found, with BeautifulSoup whole-document
+    parsing as the fallback when lxml isn't installed. Repeat scrapes
+    revalidate with ETag/Last-Modified and reuse the cached result on
+    304 Not Modified, skipping both download and parse.
     """
-    if not url or not is_valid_url(url):
+    if not is_valid_url(url):
         return ""
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        resp = _safe_get(url, headers=headers, timeout=10)
+        with _scrape_cache_lock:
+            cached = _SCRAPE_CACHE.get(url)
+        headers = {"Accept-Encoding": _HTML_ACCEPT_ENCODING}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        
+        # Browser User-Agent comes from the shared session headers
+        resp = _safe_get(url, headers=headers, timeout=10, stream=True)
         if not resp:
             return ""
         
-        # Use html5lib parser (pure Python, no compilation issues)
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(resp.content, 'html5lib')
-        
-        # Remove script and style elements
-        for script in soup(["script", "style", "nav", "header", "footer"]):
-            script.decompose()
+        if resp.status_code == 304 and cached:
+            resp.close()
+            with _scrape_cache_lock:
+                if url in _SCRAPE_CACHE:
+                    _SCRAPE_CACHE.move_to_end(url)
+            return cached[2]
         
-        # Extract key information
-        extracted_data = {}
-        
-        # Title
-        title = soup.find('title')
-        extracted_data['title'] = title.get_text().strip() if title else ""
-        
-        # Meta description
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        extracted_data['description'] = meta_desc.get('content', '').strip() if meta_desc else ""
-        
-        # H1 headings
-        h1s = [h1.get_text().strip() for h1 in soup.find_all('h1')[:2]]
-        extracted_data['headings'] = h1s
-        
-        # First meaningful paragraph
-        first_p = soup.find('p')
-        extracted_data['first_paragraph'] = first_p.get_text().strip()[:300] if first_p else ""
-        
-        # Try to find main content
-        main_content = ""
-        content_selectors = ['main', 'article', '.content', '#content', '.main-content']
-        for selector in content_selectors:
-            main_elem = soup.select_one(selector)
-            if main_elem:
-                main_text = main_elem.get_text().strip()
-                if len(main_text) > 50:  # Only use if substantial content
-                    main_content = main_text[:500]
-                    break
-        
-        # If no main content found, get body text
-        if not main_content:
-            body = soup.find('body')
-            if body:
-                main_content = body.get_text().strip()[:500]
+        if etree is not None:
+            extracted_data = _extract_streaming(resp)
+        else:
+            content = b"".join(_iter_capped(resp))
+            resp.close()
+            extracted_data = _parse_html(content, _header_charset(resp))
+        main_content = extracted_data['main_content']
         
         # Clean up the main content
         if main_content:
@@ -152,7 +521,9 @@ def scrape_website_content(url: str):
             summary_parts.append(f"Content: {extracted_data['first_paragraph']}")
         
         result = " | ".join([part for part in summary_parts if part])
-        return result if result else "Website content extracted but limited text available"
+        result = result if result else "Website content extracted but limited text available"
+        _store_scrape_result(url, resp, result)
+        return result
         
     except Exception as e:
         print(f"[ERROR] Website scraping failed for {url}: {e}")
@@ -161,6 +532,7 @@ def scrape_website_content(url: str):
 # -------------------------
 # SERPER: Strategic market research
 # -------------------------
+@ttl_cache(key=lambda query, num=3: (query.strip().lower(), num))
 def _fetch_serper_organic(query: str, num: int = 3):
     """Internal Serper call for organic results only."""
     if not SERPER_API_KEY:
@@ -175,7 +547,7 @@ def _fetch_serper_organic(query: str, num: int = 3):
         return []
 
     try:
-        data = resp.json()
+        data = orjson.loads(resp.content)
         organic = data.get("organic") or data.get("results") or data.get("organic_results") or []
         context_data = []
         for item in organic:
@@ -199,11 +571,9 @@ def fetch_strategic_context(company_name: str, industry: str = ""):
     Intentional market research using Serper for business intelligence.
     """
     # Add disambiguation terms for common word company names
-    disambiguation_terms = " company tech startup business inc"
-    
     strategic_queries = [
-        f"{company_name}{disambiguation_terms} competitors market position",
-        f"{company_name}{disambiguation_terms} growth funding {industry}",
+        f"{company_name}{_STRATEGIC_DISAMBIGUATION} competitors market position",
+        f"{company_name}{_STRATEGIC_DISAMBIGUATION} growth funding {industry}",
         f'"{company_name}" company business model'
     ]
     
@@ -224,6 +594,7 @@ def fetch_serper_results(query: str, num: int = 5):
 # -------------------------
 # BRANDFETCH: logo + canonical name
 # -------------------------
+@ttl_cache(key=lambda domain: _normalize_domain(domain or ""))
 def fetch_brandfetch_data(domain: str):
     """
     Return dict: {logo, name}
@@ -243,7 +614,7 @@ def fetch_brandfetch_data(domain: str):
         return {}
 
     try:
-        data = resp.json()
+        data = orjson.loads(resp.content)
         logos = data.get("logos") or []
         logo_url = ""
         if logos and isinstance(logos, list):
@@ -285,6 +656,7 @@ def fetch_brandfetch_data_enhanced(domain: str):
 # -------------------------
 # DUCKDUCKGO - primary summary (WITH DISAMBIGUATION)
 # -------------------------
+@ttl_cache(key=lambda company: company.strip().lower())
 def fetch_duckduckgo_summary(company: str):
     """
     Returns a short summary string, or empty string if none found.
@@ -292,11 +664,8 @@ def fetch_duckduckgo_summary(company: str):
     """
     try:
         # Add disambiguation for common word companies
-        common_words = ['stochastic', 'quantum', 'vector', 'matrix', 'alpha', 'beta', 'gamma', 
-                       'delta', 'sigma', 'lambda', 'omega', 'zen', 'nova', 'pulse', 'flux']
-        
         query = f"{company}"
-        if company.lower() in common_words:
+        if company.lower() in _DISAMBIGUATION_WORDS:
             query = f"{company} company tech startup business"
         
         url = "https://api.duckduckgo.com/"
@@ -304,13 +673,12 @@ def fetch_duckduckgo_summary(company: str):
         resp = _safe_get(url, params=params, timeout=8)
         if not resp:
             return ""
-        data = resp.json()
+        data = orjson.loads(resp.content)
         summary = data.get("AbstractText") or data.get("Heading") or ""
         
         # Filter out conceptual definitions - look for company/business indicators
         if summary:
-            company_indicators = ['company', 'startup', 'tech', 'business', 'inc', 'corp', 'ltd', 'founder', 'CEO', 'venture']
-            is_conceptual = any(indicator in summary.lower() for indicator in company_indicators)
+            is_conceptual = bool(_COMPANY_INDICATOR_RE.search(summary))
             
             if not is_conceptual and len(summary.split()) > 20:
                 # This might be a conceptual definition, not a company
@@ -324,7 +692,7 @@ def fetch_duckduckgo_summary(company: str):
                         t = r.get("Text") or r.get("Result") or ""
                         if t:
                             # Check if this looks like company information
-                            if any(indicator in t.lower() for indicator in company_indicators):
+                            if _COMPANY_INDICATOR_RE.search(t):
                                 summary = t
                                 break
         return summary or ""
@@ -335,6 +703,7 @@ def fetch_duckduckgo_summary(company: str):
 # -------------------------
 # NEWSDATA - primary news source (WITH DISAMBIGUATION)
 # -------------------------
+@ttl_cache(key=lambda company_name, limit=3: (company_name.strip().lower(), limit))
 def fetch_news_articles(company_name: str, limit: int = 3):
     """
     Returns list of {"title", "link"}.
@@ -346,9 +715,8 @@ def fetch_news_articles(company_name: str, limit: int = 3):
 
     try:
         # Add disambiguation for common words
-        common_words = ['stochastic', 'quantum', 'vector', 'matrix', 'alpha', 'beta']
         query = company_name
-        if company_name.lower() in common_words:
+        if company_name.lower() in _DISAMBIGUATION_WORDS:
             query = f'"{company_name}" company OR "{company_name}" startup OR "{company_name}" tech'
         
         url = "https://newsdata.io/api/1/news"
@@ -356,7 +724,7 @@ def fetch_news_articles(company_name: str, limit: int = 3):
         resp = _safe_get(url, params=params, timeout=8)
         if not resp:
             return []
-        data = resp.json()
+        data = orjson.loads(resp.content)
         results = data.get("results") or data.get("articles") or []
         out = []
         for a in results[:limit]:
@@ -369,6 +737,16 @@ def fetch_news_articles(company_name: str, limit: int = 3):
         print(f"[ERROR] NewsData fetch failed: {e}")
         return []
 
+_NORM_RE = re.compile(r'[^a-z0-9 ]+')
+
+def _news_title_key(title: str) -> str:
+    """
+    Canonical dedupe key: "Foo: Bar" and "Foo - Bar" both become "foo bar".
+    Titles with no ASCII letters or digits (e.g. non-Latin scripts) keep
+    their plain lowercased text so they aren't dropped.
+    """
+    return ' '.join(_NORM_RE.sub(' ', title.lower()).split()) or title.lower().strip()
+
 def fetch_news_articles_enhanced(company_name: str, domain: str = "", limit: int = 5):
     """
     News search that uses both company name AND domain
@@ -384,16 +762,14 @@ def fetch_news_articles_enhanced(company_name: str, domain: str = "", limit: int
         domain_articles = fetch_news_articles(clean_domain, limit)
         articles.extend(domain_articles)
     
-    seen_titles = set()
-    unique_articles = []
-    
+    # First occurrence per canonical title wins; dicts keep insertion order
+    articles_by_key = {}
     for article in articles:
-        title = article.get('title', '').lower().strip()
-        if title and title not in seen_titles:
-            seen_titles.add(title)
-            unique_articles.append(article)
+        key = _news_title_key(article.get('title') or '')
+        if key:
+            articles_by_key.setdefault(key, article)
     
-    return unique_articles[:limit]
+    return list(articles_by_key.values())[:limit]
 
 # -------------------------
 # OFFICIAL WEBSITE HELPER 
@@ -401,19 +777,28 @@ def fetch_news_articles_enhanced(company_name: str, domain: str = "", limit: int
 def find_official_website(company_name: str):
     """
     Try to discover an official website for the company.
+    Inputs that are already a URL or domain are returned without a lookup.
     """
+    candidate = company_name.strip()
+    if "." in candidate and not any(ch.isspace() for ch in candidate):
+        if is_valid_url(candidate):
+            return candidate
+        if not candidate.startswith("http"):
+            candidate = "https://" + candidate
+        if is_valid_url(candidate):
+            return candidate
+
     try:
         # Use disambiguation for common words
-        common_words = ['stochastic', 'quantum', 'vector', 'matrix', 'alpha', 'beta']
         query = f"{company_name} official website"
-        if company_name.lower() in common_words:
+        if company_name.lower() in _DISAMBIGUATION_WORDS:
             query = f"{company_name} company official website tech startup"
         
         ddg_url = "https://api.duckduckgo.com/"
         params = {"q": query, "format": "json", "no_html": 1}
         resp = _safe_get(ddg_url, params=params, timeout=6)
         if resp:
-            data = resp.json()
+            data = orjson.loads(resp.content)
             related = data.get("RelatedTopics", [])
             if related and isinstance(related, list):
                 first = related[0]
@@ -426,15 +811,6 @@ def find_official_website(company_name: str):
     except Exception as e:
         print(f"[WARN] find_official_website ddg part failed: {e}")
 
-    if "." in company_name and len(company_name.split(".")) >= 2:
-        candidate = company_name.strip()
-        if is_valid_url(candidate):
-            return candidate
-        if not candidate.startswith("http"):
-            candidate = "https://" + candidate
-        if is_valid_url(candidate):
-            return candidate
-
     try:
         strategic_data = fetch_strategic_context(company_name, "")
         if strategic_data:
@@ -460,15 +836,63 @@ def _call_groq_chat(payload):
     if not resp:
         return None
     try:
-        return resp.json()
+        return orjson.loads(resp.content)
     except Exception as e:
         print(f"[ERROR] parse Groq response: {e}")
         return None
 
+# Keyword rules for the common case; the Groq call only handles the rest.
+# Only industry-specific terms count: words like "platform" or "cloud"
+# show up in nearly every company summary.
+_INDUSTRY_RULES = [
+    (re.compile(r"\b(fintech|banking|banks?|payments?|payment processing|financial services|financial infrastructure|lending|loans?|insurance|insurtech|crypto|blockchain)\b", re.I), "FinTech"),
+    (re.compile(r"\b(healthcare|biotech|pharma\w*|medical|clinical|hospitals?|therapeutics|patients?)\b", re.I), "Healthcare"),
+    (re.compile(r"\b(artificial intelligence|machine learning|deep learning|LLMs?|large language models?|neural networks?)\b", re.I), "Artificial Intelligence"),
+    (re.compile(r"\b(cybersecurity|threat detection|malware|ransomware|encryption|zero trust)\b", re.I), "Cybersecurity"),
+    (re.compile(r"\b(e-?commerce|retailers?|online store|shopping|consumer goods)\b", re.I), "E-commerce & Retail"),
+    (re.compile(r"\b(education|edtech|students?|universit(y|ies)|schools?)\b", re.I), "EdTech"),
+    (re.compile(r"\b(real estate|proptech|mortgages?|housing)\b", re.I), "Real Estate"),
+    (re.compile(r"\b(solar|renewables?|batter(y|ies)|cleantech|electricity|wind power)\b", re.I), "Energy & CleanTech"),
+    (re.compile(r"\b(automotive|automakers?|electric vehicles?|EVs?|autonomous driving)\b", re.I), "Automotive & Mobility"),
+    (re.compile(r"\b(logistics|shipping|freight|supply chain|warehous\w*)\b", re.I), "Logistics & Supply Chain"),
+    (re.compile(r"\b(private equity|venture capital|investment firm|portfolio compan(y|ies)|asset management|buyouts?)\b", re.I), "Investment & Private Equity"),
+    (re.compile(r"\b(video games?|gaming|esports|game studio)\b", re.I), "Gaming"),
+    (re.compile(r"\b(entertainment|streaming service|music|film|publishing)\b", re.I), "Media & Entertainment"),
+    (re.compile(r"\b(telecom\w*|wireless carrier|5G|broadband|network operator)\b", re.I), "Telecommunications"),
+    (re.compile(r"\b(SaaS|enterprise software|software-as-a-service)\b", re.I), "Software & SaaS"),
+    (re.compile(r"\b(consulting|consultancy|advisory firm|professional services)\b", re.I), "Consulting"),
+]
+INDUSTRY_RULE_MIN_HITS = 2    # keyword hits required before trusting a rule
+INDUSTRY_RULE_MIN_MARGIN = 2  # lead over the runner-up rule; closer calls go to Groq
+
+def _classify_industry_locally(summary: str):
+    """Return the best-matching rule label, or None if no rule clearly wins."""
+    if not summary:
+        return None
+    scores = sorted(
+        ((len(pattern.findall(summary)), label) for pattern, label in _INDUSTRY_RULES),
+        key=lambda score: score[0],
+        reverse=True
+    )
+    (best_hits, best_label), (runner_up_hits, _) = scores[0], scores[1]
+    if best_hits >= INDUSTRY_RULE_MIN_HITS and best_hits - runner_up_hits >= INDUSTRY_RULE_MIN_MARGIN:
+        return best_label
+    return None
+
+@ttl_cache(
+    ttl=INDUSTRY_CACHE_TTL,
+    key=lambda company_name, summary: (company_name.strip().lower(), summary),
+    cache_if=lambda industry: bool(industry) and industry != "Unknown"
+)
 def infer_industry(company_name: str, summary: str):
     """
-    Short, low-cost industry inference using Groq.
+    Short, low-cost industry inference: keyword rules first, Groq only when
+    no rule matches confidently.
     """
+    local_industry = _classify_industry_locally(summary)
+    if local_industry:
+        return local_industry
+
     prompt = f"Classify the industry for the company named '{company_name}'. Summary: {summary or 'No summary available.'}\nReturn a short phrase like 'FinTech', 'AI Consulting', 'Healthcare SaaS'."
     payload = {
         "model": "moonshotai/kimi-k2-instruct-0905",
@@ -488,10 +912,38 @@ def infer_industry(company_name: str, summary: str):
 # -------------------------
 # COMPREHENSIVE COMPANY RESEARCH (MAIN FUNCTION)
 # -------------------------
-def research_company_thoroughly(company_name: str, website: str = ""):
+async def _run_blocking(pool, func, *args, default=None, timeout=None):
     """
-    MAIN FUNCTION: Properly research company using ALL available inputs
+    Run a blocking fetcher on the research call's pool. Errors, and fetches
+    still running after `timeout` (sized from the fetcher's retry budget),
+    fall back to default.
     """
+    try:
+        future = pool.submit(func, *args)
+        return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+    except asyncio.TimeoutError:
+        print(f"[ERROR] {func.__name__} timed out after {timeout:.0f}s")
+        return default
+    except Exception as e:
+        print(f"[ERROR] {func.__name__} failed: {e}")
+        return default
+
+async def research_company_thoroughly_async(company_name: str, website: str = "", llm_industry: bool = True):
+    """
+    MAIN FUNCTION: Properly research company using ALL available inputs.
+    Independent sources are fetched concurrently, so latency is the slowest
+    call per stage rather than the sum of all calls.
+    With llm_industry=False only the local keyword rules classify the
+    industry, leaving the LLM fallback to generate_ai_insight_with_industry.
+    """
+    pool = ThreadPoolExecutor(max_workers=ENRICH_MAX_WORKERS, thread_name_prefix="enrich")
+    try:
+        return await _research_on_pool(pool, company_name, website, llm_industry)
+    finally:
+        # Don't block on a fetch that already timed out; it finishes on its own
+        pool.shutdown(wait=False, cancel_futures=True)
+
+async def _research_on_pool(pool, company_name: str, website: str, llm_industry: bool):
     results = {
         "company_name": company_name,
         "website": website,
@@ -505,28 +957,37 @@ def research_company_thoroughly(company_name: str, website: str = ""):
     
     # If no website provided, try to find it
     if not website:
-        website = find_official_website(company_name)
+        # DuckDuckGo, then up to two Serper queries
+        website = await _run_blocking(
+            pool, find_official_website, company_name,
+            default="", timeout=_retry_budget(6) + _retry_budget(15, calls=2)
+        )
         results["website"] = website
     
     domain = extract_domain(website) if website else ""
     
-    # SOURCE 1: BRANDFETCH (if we have domain)
-    if domain:
-        brand_data = fetch_brandfetch_data_enhanced(domain)
-        if brand_data:
-            results["logo"] = brand_data.get("logo", "")
-            results["canonical_name"] = brand_data.get("name", company_name)
-            results["sources_used"].append("Brandfetch")
-    
-    # SOURCE 2: DIRECT WEBSITE SCRAPING (for niche companies)
-    website_content = ""
-    if website:
-        website_content = scrape_website_content(website)
-        if website_content:
-            results["sources_used"].append("Website Content")
+    # SOURCES 1 + 2: BRANDFETCH (if we have domain) and DIRECT WEBSITE SCRAPING
+    # (for niche companies) only need the website, so run them together
+    brand_data, website_content = await asyncio.gather(
+        # Brandfetch tries the domain plus up to three variations
+        _run_blocking(pool, fetch_brandfetch_data_enhanced, domain, default={}, timeout=_retry_budget(8, calls=4)),
+        _run_blocking(pool, scrape_website_content, website, default="", timeout=_retry_budget(10))
+    )
+    if brand_data:
+        results["logo"] = brand_data.get("logo", "")
+        results["canonical_name"] = brand_data.get("name", company_name)
+        results["sources_used"].append("Brandfetch")
+    if website_content:
+        results["sources_used"].append("Website Content")
     
-    # SOURCE 3: DUCKDUCKGO (with proper company name)
-    ddg_summary = fetch_duckduckgo_summary(results["canonical_name"])
+    # SOURCES 3 + 4: DUCKDUCKGO and NEWS both key off the canonical name
+    ddg_summary, news_articles = await asyncio.gather(
+        _run_blocking(pool, fetch_duckduckgo_summary, results["canonical_name"], default="", timeout=_retry_budget(8)),
+        _run_blocking(
+            pool, fetch_news_articles_enhanced, results["canonical_name"], domain, 5,
+            default=[], timeout=_retry_budget(8, calls=2)
+        )
+    )
     if ddg_summary:
         results["summary"] = ddg_summary
         results["sources_used"].append("DuckDuckGo")
@@ -534,23 +995,79 @@ def research_company_thoroughly(company_name: str, website: str = ""):
         results["summary"] = website_content
         results["sources_used"].append("Website Summary")
     
-    # SOURCE 4: NEWS (using both name and domain)
-    news_articles = fetch_news_articles_enhanced(results["canonical_name"], domain, 5)
     if news_articles:
         results["news"] = news_articles
         results["sources_used"].append("NewsData")
     
     # SOURCE 5: INDUSTRY INFERENCE
-    if results["summary"]:
-        results["industry"] = infer_industry(results["canonical_name"], results["summary"])
+    if results["summary"] and llm_industry:
+        results["industry"] = await _run_blocking(
+            pool, infer_industry, results["canonical_name"], results["summary"],
+            default="Unknown", timeout=_retry_budget(20)
+        )
         results["sources_used"].append("AI Industry Classification")
+    elif results["summary"]:
+        local_industry = _classify_industry_locally(results["summary"])
+        if local_industry:
+            results["industry"] = local_industry
+            results["sources_used"].append("AI Industry Classification")
     
     return results
 
+def research_company_thoroughly(company_name: str, website: str = "", llm_industry: bool = True):
+    """
+    Sync wrapper around research_company_thoroughly_async for existing callers.
+    Must not be called from a running event loop (use the async version there).
+    """
+    return asyncio.run(research_company_thoroughly_async(company_name, website, llm_industry))
+
 def generate_ai_insight(enriched_lead: dict, include_strategic_context: bool = False):
     """
     Enhanced AI insights that actually use the properly researched data
     """
+    insight, _ = generate_ai_insight_with_industry(
+        enriched_lead, include_strategic_context, classify_industry=False
+    )
+    return insight
+
+_NUMBERED_HEADING_RE = re.compile(r"^\d\)")
+
+def _analysis_bullets(body) -> list:
+    """Bullet strings for one section of a structured JSON-mode analysis."""
+    if isinstance(body, dict):
+        return [f"{key}: {'; '.join(_analysis_bullets(value))}" for key, value in body.items()]
+    if isinstance(body, list):
+        return [bullet for item in body for bullet in _analysis_bullets(item)]
+    text = str(body).strip() if body is not None else ""
+    return [text] if text else []
+
+def _flatten_analysis(analysis):
+    """
+    JSON mode sometimes nests the sections as an object or list. Render those
+    as the "1) Heading - bullet" text the frontend parses; None if unusable.
+    """
+    if isinstance(analysis, str):
+        return analysis.strip() or None
+    if isinstance(analysis, list) and all(isinstance(item, str) for item in analysis):
+        return "\n".join(item.strip() for item in analysis if item.strip()) or None
+    if isinstance(analysis, dict):
+        sections = []
+        for number, (heading, body) in enumerate(analysis.items(), 1):
+            heading = str(heading).strip()
+            if not _NUMBERED_HEADING_RE.match(heading):
+                heading = f"{number}) {heading}"
+            bullets = _analysis_bullets(body)
+            sections.append("\n".join([heading] + [f"   - {bullet}" for bullet in bullets]))
+        return "\n\n".join(sections) or None
+    return None
+
+def generate_ai_insight_with_industry(enriched_lead: dict, include_strategic_context: bool = False,
+                                      classify_industry: bool = True):
+    """
+    Generate the strategic insight and, when the lead has no industry yet,
+    classify it in the same Groq request (JSON mode) instead of a separate
+    infer_industry round trip. Returns (insight_text, industry).
+    """
     company = enriched_lead.get("company_name", "")
     canonical_name = enriched_lead.get("canonical_name", company)
     summary = enriched_lead.get("summary", "") 
@@ -559,6 +1076,14 @@ def generate_ai_insight(enriched_lead: dict, include_strategic_context: bool = F
     news = enriched_lead.get("news", [])
     sources = enriched_lead.get("sources_used", [])
     
+    # Keyword rules are free; only ask the LLM when they aren't confident
+    needs_industry = classify_industry and (not industry or industry == "Unknown")
+    if needs_industry:
+        local_industry = _classify_industry_locally(summary)
+        if local_industry:
+            industry = local_industry
+            needs_industry = False
+    
     # Build RICH context from actual research
     context_parts = []
     
@@ -624,6 +1149,14 @@ Provide substantive insights in these THREE sections:
 - Keep each section concise but comprehensive
 - Use bullet points for clarity
 - Ensure the analysis flows logically between sections
+"""
+
+    if needs_industry:
+        prompt += """
+**OUTPUT FORMAT:**
+Respond with a JSON object with exactly two keys:
+- "industry": a short industry phrase like 'FinTech', 'AI Consulting', 'Healthcare SaaS'
+- "analysis": the complete three-section assessment above as a single string
 """
 
     payload = {
@@ -632,20 +1165,38 @@ Provide substantive insights in these THREE sections:
         "max_tokens": 1200,  # Increased from 600 to 1200
         "temperature": 0.3
     }
+    if needs_industry:
+        payload["response_format"] = {"type": "json_object"}
+        # JSON escaping and the industry field share the same token budget
+        payload["max_tokens"] = INSIGHT_JSON_MAX_TOKENS
 
+    industry = industry or "Unknown"
     resp = _call_groq_chat(payload)
     if not resp:
-        return "Analysis generation failed. Please check the company website and try again."
+        return "Analysis generation failed. Please check the company website and try again.", industry
     
     try:
         content = resp["choices"][0]["message"]["content"].strip()
         
+        if needs_industry:
+            try:
+                data = orjson.loads(content)
+            except ValueError:
+                data = None
+            analysis = _flatten_analysis(data.get("analysis")) if isinstance(data, dict) else None
+            if not analysis:
+                # Truncated or malformed JSON; never show the raw payload as analysis
+                print("[WARN] Groq insight response was not valid JSON")
+                return "Analysis generation failed. Please check the company website and try again.", industry
+            industry = str(data.get("industry") or "").strip() or "Unknown"
+            content = analysis
+        
         # Check if the response was likely truncated
         if content and not content.endswith(('.', '!', '?')) and len(content.split()) > 300:
             # Response was probably truncated, try a shorter version
-            return "Analysis was truncated. Please try again with the 'Strategic Research' option disabled, or provide a company website for more focused analysis."
+            return "Analysis was truncated. Please try again with the 'Strategic Research' option disabled, or provide a company website for more focused analysis.", industry
         
-        return content
+        return content, industry
     except Exception as e:
         print(f"[ERROR] AI insight generation failed: {e}")
-        return "Analysis generation failed due to technical error."
\ No newline at end of file
+        return "Analysis generation failed due to technical error.", industry
\ No newline at end of file
@@ -0,0 +1,67 @@
+# src/backend/utils/cache.py
+
+import copy
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+
+CACHE_MAXSIZE = 2048
+CACHE_TTL = 3600  # seconds
+
+_MISSING = object()
+
+def ttl_cache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL, key=None, cache_if=bool):
+    """
+    In-process LRU + TTL memoization for sync or async functions. Results
+    failing cache_if (empty / failed lookups) are not stored so they get
+    retried. Values are deep-copied in and out so callers can't mutate
+    a cached entry.
+    """
+    def decorator(func):
+        cache = OrderedDict()
+        lock = threading.Lock()
+
+        def make_key(args, kwargs):
+            return key(*args, **kwargs) if key else (args, tuple(sorted(kwargs.items())))
+
+        def lookup(cache_key):
+            with lock:
+                hit = cache.get(cache_key)
+                if hit and time.monotonic() - hit[0] < ttl:
+                    cache.move_to_end(cache_key)
+                    return copy.deepcopy(hit[1])
+            return _MISSING
+
+        def store(cache_key, value):
+            if not cache_if(value):
+                return
+            with lock:
+                cache[cache_key] = (time.monotonic(), copy.deepcopy(value))
+                cache.move_to_end(cache_key)
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                cache_key = make_key(args, kwargs)
+                value = lookup(cache_key)
+                if value is _MISSING:
+                    value = await func(*args, **kwargs)
+                    store(cache_key, value)
+                return value
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                cache_key = make_key(args, kwargs)
+                value = lookup(cache_key)
+                if value is _MISSING:
+                    value = func(*args, **kwargs)
+                    store(cache_key, value)
+                return value
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
@@ -1,5 +1,8 @@
 # src/backend/utils/data_cleaner.py
 
+# Values treated as "missing" and dropped from cleaned leads
+_EMPTY_VALUES = (None, "", [], {})
+
 def clean_enriched_data(leads: list[dict]) -> list[dict]:
     """
     Remove duplicates, empty entries, and normalize structure in enriched leads.
@@ -8,15 +11,15 @@ def clean_enriched_data(leads: list[dict]) -> list[dict]:
     cleaned = []
 
     for lead in leads:
-        name = lead.get("company_name", "").strip().lower()
+        name = (lead.get("company_name") or "").strip().lower()
         if not name or name in seen:
             continue
+        seen.add(name)
 
         # Normalize keys and drop Nones
-        lead = {k: v for k, v in lead.items() if v not in [None, "", [], {}]}
+        lead = {k: v for k, v in lead.items() if v not in _EMPTY_VALUES}
         lead["company_name"] = name.title()
 
         cleaned.append(lead)
-        seen.add(name)
 
     return cleaned
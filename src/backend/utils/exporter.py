@@ -1,13 +1,30 @@
 import os
 import csv
 from datetime import datetime
-import json
+import orjson
+from itertools import chain
 
-def export_to_csv(leads: list[dict], folder: str = "src/backend/data/processed"):
+# Columns every export carries, after whatever the first lead defines
+EXPORT_COLUMNS = (
+    "company_name", "canonical_name", "website", "industry", "summary",
+    "logo", "news", "sources_used", "strategic_insight", "research_depth",
+)
+
+def _coerce(value):
+    """Convert lists/dicts to compact JSON strings; pass everything else through."""
+    if isinstance(value, (list, dict)):
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return value
+
+def export_to_csv(leads, folder: str = "src/backend/data/processed"):
     """
     Export enriched + AI-analyzed leads to a timestamped CSV file (readable format).
+    Rows are written in a single pass, so `leads` may be any iterable of dicts.
+    Keys not in the first lead or EXPORT_COLUMNS are left out.
     """
-    if not leads:
+    rows = iter(leads or ())
+    first = next(rows, None)
+    if first is None:
         print("[INFO] No leads to export.")
         return None
 
@@ -16,23 +33,16 @@ def export_to_csv(leads: list[dict], folder: str = "src/backend/data/processed")
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     file_path = os.path.join(folder, f"leads_export_{timestamp}.csv")
 
-    # Collect unique keys
-    all_keys = set()
-    for lead in leads:
-        all_keys.update(lead.keys())
+    fieldnames = list(first.keys())
+    fieldnames += [key for key in EXPORT_COLUMNS if key not in first]
 
+    count = 0
     with open(file_path, mode="w", newline="", encoding="utf-8") as file:
-        writer = csv.DictWriter(file, fieldnames=list(all_keys))
-        writer.writeheader()
-        for lead in leads:
-            row = {}
-            for key, value in lead.items():
-                # Convert lists/dicts to clean strings
-                if isinstance(value, (list, dict)):
-                    row[key] = json.dumps(value, ensure_ascii=False)
-                else:
-                    row[key] = value
-            writer.writerow(row)
-
-    print(f"[EXPORT SUCCESS] Saved {len(leads)} leads → {file_path}")
+        writer = csv.writer(file)
+        writer.writerow(fieldnames)
+        for lead in chain((first,), rows):
+            writer.writerow([_coerce(lead.get(key)) for key in fieldnames])
+            count += 1
+
+    print(f"[EXPORT SUCCESS] Saved {count} leads → {file_path}")
     return file_path
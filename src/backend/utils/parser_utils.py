@@ -3,6 +3,8 @@
 import re
 from urllib.parse import urlparse
 
+_SUFFIX_RE = re.compile(r"\s+(inc\.?|ltd\.?|corp\.?|co\.?)$", re.I)
+
 def extract_domain(url: str) -> str:
     """Extract clean domain name from URL."""
     if not url:
@@ -17,5 +19,5 @@ def normalize_company_name(name: str) -> str:
     if not name:
         return ""
     name = name.strip()
-    name = re.sub(r"\s+(inc\.?|ltd\.?|corp\.?|co\.?)$", "", name, flags=re.I)
+    name = _SUFFIX_RE.sub("", name)
     return name.title()
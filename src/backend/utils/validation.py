@@ -1,18 +1,28 @@
 # src/backend/utils/validation.py
 
 import re
+from functools import lru_cache
 from urllib.parse import urlparse
 
-def is_valid_url(url: str) -> bool:
-    """Basic URL validation."""
+_COMPANY_NAME_RE = re.compile(r"^[A-Za-z0-9 &.\-]+$")
+
+@lru_cache(maxsize=4096)
+def parse_url(url: str) -> tuple[bool, str]:
+    """Parse a URL once and return (is a valid http(s) URL, netloc)."""
     try:
         result = urlparse(url)
-        return all([result.scheme, result.netloc])
-    except:
+    except Exception:
+        return False, ""
+    return result.scheme in ("http", "https") and bool(result.netloc), result.netloc
+
+def is_valid_url(url: str) -> bool:
+    """Basic URL validation (http/https with a host)."""
+    if not url:
         return False
+    return parse_url(url)[0]
 
 def is_valid_company_name(name: str) -> bool:
     """Ensure company name isn't gibberish or too short."""
     if not name or len(name.strip()) < 2:
         return False
-    return re.match(r"^[A-Za-z0-9 &.\-]+$", name.strip()) is not None
+    return _COMPANY_NAME_RE.match(name.strip()) is not None